@@ -9,61 +9,89 @@ and PyPy. Make sure ffmpeg is installed and available on PATH before using it.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Sequence, Tuple
 
 
+# Anchored pattern so the engine never backtracks: optional HH:, optional MM:,
+# mandatory seconds with optional decimals. With one colon the captured group
+# is the minutes one, keeping MM:SS semantics.
+_TS_RE = re.compile(r"^\s*(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)\s*$")
+
+
+@functools.lru_cache(maxsize=256)
 def parse_timestamp(value: str) -> float:
     """
     Accepts timestamps as seconds (float/int) or as HH:MM:SS(.mmm) and
     returns their value in seconds.
+
+    Results are memoized: the GUI re-parses the same strings on every edit
+    and slider drag, and the function is pure. Invalid inputs raise
+    ValueError and are never cached.
     """
-    value = value.strip()
-    if not value:
+    if not value.strip():
         raise ValueError("empty timestamp")
 
-    if ":" not in value:
-        try:
-            return float(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid seconds value '{value}'") from exc
-
-    parts = value.split(":")
-    if len(parts) > 3:
+    match = _TS_RE.match(value)
+    if match is None:
         raise ValueError(
-            f"Invalid timestamp '{value}'. Use SS, MM:SS or HH:MM:SS formats."
+            f"Invalid timestamp '{value.strip()}'. Use SS, MM:SS or HH:MM:SS formats."
         )
 
-    hours, minutes, seconds = 0.0, 0.0, 0.0
-    parts = [float(p) for p in parts]
-    if len(parts) == 3:
-        hours, minutes, seconds = parts
-    elif len(parts) == 2:
-        minutes, seconds = parts
-    else:
-        seconds = parts[0]
+    hours, minutes, seconds = match.groups()
+    return float(hours or 0) * 3600 + float(minutes or 0) * 60 + float(seconds)
+
 
-    return hours * 3600 + minutes * 60 + seconds
+# Last whole-second result of format_timestamp; slider-label updates mostly
+# repeat the same second, so a single compare answers them.
+_last_fmt: tuple[int, str] | None = None
 
 
 def format_timestamp(seconds: float) -> str:
-    """Return timestamp formatted as HH:MM:SS.mmm for ffmpeg."""
-    millis = round(seconds * 1000)
-    hours, remainder = divmod(millis, 3600_000)
-    minutes, remainder = divmod(remainder, 60_000)
-    secs = remainder / 1000
-    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+    """
+    Return timestamp formatted as HH:MM:SS.mmm for ffmpeg.
+
+    Works on milliseconds as plain ints end to end: the GUI calls this on
+    every position update, and all-integer divmod/formatting skips the float
+    division and the float-format path entirely. Whole-second values reuse
+    the previously formatted string.
+    """
+    global _last_fmt
+    millis = int(seconds * 1000 + 0.5)
+    # Cache only values that land exactly on a second after millisecond
+    # rounding; a float-tolerance test here would conflate X.000 with X.001.
+    whole = millis // 1000 if millis % 1000 == 0 else -1
+    # Snapshot the global: GUI thread and cut workers run this concurrently,
+    # and _last_fmt may be replaced between the compare and the return.
+    cached = _last_fmt
+    if whole >= 0 and cached is not None and cached[0] == whole:
+        return cached[1]
+    hours, millis = divmod(millis, 3600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    formatted = f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    if whole >= 0:
+        _last_fmt = (whole, formatted)
+    return formatted
 
 
 def build_output_path(input_path: Path, suffix: str) -> Path:
-    stem = input_path.stem
-    return input_path.with_name(f"{stem}_{suffix}{input_path.suffix}")
+    # String splitext/concat beats Path.with_name here: no intermediate Path
+    # objects in batch loops.
+    root, ext = os.path.splitext(os.fspath(input_path))
+    return Path(f"{root}_{suffix}{ext}")
 
 
-def ensure_ffmpeg_available() -> str:
+@functools.lru_cache(maxsize=1)
+def _resolve_ffmpeg() -> str:
     """
     Locate ffmpeg, preferring an embedded binary bundled with the app, then PATH.
 
@@ -74,6 +102,8 @@ def ensure_ffmpeg_available() -> str:
       - Project-relative vendors/ffmpeg/bin/ffmpeg.exe (for dev runs)
       - PATH
 
+    The result is memoized so the candidate scan only hits the filesystem
+    once per process.
     On non-Windows, the same without the .exe suffix.
     """
     is_windows = sys.platform.startswith("win")
@@ -106,8 +136,27 @@ def ensure_ffmpeg_available() -> str:
     except Exception:
         pass
 
+    # One scandir per unique parent directory instead of a stat per
+    # candidate; several candidates share the same handful of directories.
+    # NTFS resolves names case-insensitively, so compare casefolded on
+    # Windows (a vendored FFmpeg.exe must still match ffmpeg.exe).
+    dir_files: dict[Path, set[str]] = {}
     for path in candidates:
-        if path.is_file():
+        parent = path.parent
+        names = dir_files.get(parent)
+        if names is None:
+            names = set()
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            names.add(
+                                entry.name.lower() if is_windows else entry.name
+                            )
+            except OSError:
+                pass
+            dir_files[parent] = names
+        if (path.name.lower() if is_windows else path.name) in names:
             return str(path)
 
     # Fallback to PATH
@@ -121,35 +170,360 @@ def ensure_ffmpeg_available() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _resolve_ffprobe() -> str | None:
+    """Locate ffprobe on PATH once per process; ``None`` if missing."""
+    return shutil.which("ffprobe")
+
+
+def ensure_ffmpeg_available() -> str:
+    """Return the memoized ffmpeg path, resolving it on first use."""
+    return _resolve_ffmpeg()
+
+
+# Constant argv pieces shared by every ffmpeg invocation.
+_FFMPEG_PREFIX = ("-hide_banner", "-loglevel", "error", "-y")
+_FFMPEG_COPY = ("-c", "copy")
+
+
 def build_command(
     ffmpeg_path: str,
-    input_file: Path,
-    output_file: Path,
+    input_file: Path | str,
+    output_file: Path | str,
     start_ts: str,
-    end_ts: str,
+    duration_ts: str,
 ) -> Tuple[str, ...]:
-    # Use stream copy (-c copy) to avoid re-encoding when possible.
+    # Use stream copy (-c copy) to avoid re-encoding when possible. -ss goes
+    # before -i so ffmpeg uses the fast demuxer seek instead of decoding and
+    # discarding everything up to the start; -t takes an explicit duration
+    # because end-time options are interpreted relative to the seek point in
+    # that position.
     return (
         ffmpeg_path,
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-y",
+        *_FFMPEG_PREFIX,
         "-ss",
         start_ts,
-        "-to",
-        end_ts,
+        "-t",
+        duration_ts,
         "-i",
+        os.fspath(input_file),
+        *_FFMPEG_COPY,
+        os.fspath(output_file),
+    )
+
+
+# Video codecs each container is known to hold without remuxing issues; None
+# means the container takes effectively anything (matroska).
+_CONTAINER_CODECS: dict[str, frozenset[str] | None] = {
+    ".mp4": frozenset({"h264", "hevc", "av1", "mpeg4", "vp9"}),
+    ".mov": frozenset({"h264", "hevc", "mpeg4", "prores", "mjpeg"}),
+    ".mkv": None,
+    ".webm": frozenset({"vp8", "vp9", "av1"}),
+    ".avi": frozenset({"mpeg4", "msmpeg4v3", "mjpeg", "h264"}),
+}
+
+# Head-segment encoders per source video codec for precise mode: the concat
+# demuxer needs the re-encoded head to match the stream-copied tail, so each
+# supported codec maps to its encoder; audio is stream-copied in the head and
+# therefore always matches.
+_PRECISE_HEAD_ENCODERS: dict[str, Tuple[str, ...]] = {
+    "h264": ("-c:v", "libx264", "-preset", "veryfast", "-crf", "18"),
+    "hevc": ("-c:v", "libx265", "-preset", "veryfast", "-crf", "20"),
+    "mpeg4": ("-c:v", "mpeg4", "-q:v", "3"),
+    "vp8": ("-c:v", "libvpx", "-crf", "10", "-b:v", "2M"),
+    "vp9": ("-c:v", "libvpx-vp9", "-crf", "32", "-b:v", "0"),
+}
+
+# Fallback when stream copy would produce a broken container. The default
+# libx264/aac pair suits the mp4 family; containers whose muxer rejects it
+# get their own entry.
+_REENCODE_ARGS = ("-c:v", "libx264", "-preset", "ultrafast", "-crf", "23", "-c:a", "aac")
+_REENCODE_ARGS_BY_CONTAINER: dict[str, Tuple[str, ...]] = {
+    ".webm": ("-c:v", "libvpx-vp9", "-crf", "32", "-b:v", "0", "-c:a", "libopus"),
+}
+
+
+def _reencode_args(extension: str) -> Tuple[str, ...]:
+    """Re-encode argv valid for the target container."""
+    return _REENCODE_ARGS_BY_CONTAINER.get(extension, _REENCODE_ARGS)
+
+
+def _container_accepts_codec(extension: str, codec: str | None) -> bool:
+    if codec is None:
+        # Probe unavailable: keep the historical stream-copy behaviour.
+        return True
+    accepted = _CONTAINER_CODECS.get(extension)
+    return accepted is None or codec in accepted
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_video_codec_cached(input_str: str, _mtime_ns: int) -> str | None:
+    ffprobe_path = _resolve_ffprobe()
+    if not ffprobe_path:
+        return None
+    command = (
+        ffprobe_path,
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=codec_name",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        input_str,
+    )
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError:
+        return None
+    lines = result.stdout.strip().splitlines()
+    return lines[0] if lines else None
+
+
+def probe_video_codec(input_file: Path) -> str | None:
+    """Codec name of the first video stream, memoized per (path, mtime)."""
+    try:
+        mtime_ns = input_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _probe_video_codec_cached(os.fspath(input_file), mtime_ns)
+
+
+def _find_next_keyframe(input_file: Path, start_seconds: float) -> float | None:
+    """
+    Return the pts of the first keyframe at or after ``start_seconds``,
+    probing a 10-second window with ffprobe. ``None`` if ffprobe is missing
+    or no keyframe was found in the window.
+    """
+    ffprobe_path = _resolve_ffprobe()
+    if not ffprobe_path:
+        return None
+    command = (
+        ffprobe_path,
+        "-v",
+        "error",
+        "-read_intervals",
+        f"{start_seconds}%+10",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
         str(input_file),
-        "-c",
-        "copy",
-        str(output_file),
     )
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError:
+        return None
+    for line in result.stdout.splitlines():
+        fields = line.split(",")
+        if len(fields) < 2 or "K" not in fields[1]:
+            continue
+        try:
+            pts = float(fields[0])
+        except ValueError:
+            continue
+        if pts >= start_seconds:
+            return pts
+    return None
 
 
-def cut_video(input_file: Path, start: str, end: str, output: Path | None) -> Path:
-    ffmpeg_path = ensure_ffmpeg_available()
+def _find_keyframe_before(input_file: Path, start_seconds: float) -> float | None:
+    """
+    Return the pts of the last keyframe at or before ``start_seconds``,
+    probing the 10 seconds leading up to it with ffprobe. ``None`` if
+    ffprobe is missing or the window holds no such keyframe.
+    """
+    ffprobe_path = _resolve_ffprobe()
+    if not ffprobe_path:
+        return None
+    window_start = max(0.0, start_seconds - 10)
+    command = (
+        ffprobe_path,
+        "-v",
+        "error",
+        "-read_intervals",
+        f"{window_start}%{start_seconds + 0.1}",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
+        str(input_file),
+    )
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError:
+        return None
+    best: float | None = None
+    for line in result.stdout.splitlines():
+        fields = line.split(",")
+        if len(fields) < 2 or "K" not in fields[1]:
+            continue
+        try:
+            pts = float(fields[0])
+        except ValueError:
+            continue
+        if pts <= start_seconds and (best is None or pts > best):
+            best = pts
+    return best
+
 
+def _cut_precise(
+    ffmpeg_path: str,
+    input_file: Path,
+    output_file: Path,
+    start_seconds: float,
+    end_seconds: float,
+) -> None:
+    """
+    Frame-accurate cut: re-encode only the head segment up to the next
+    keyframe and stream-copy the rest, then join both via the concat demuxer.
+    The head's video encode matches the source codec (the concat demuxer
+    requires matching streams) and its audio is stream-copied. Falls back to
+    re-encoding the whole range when no keyframe lands inside it or the
+    source codec has no matching encoder.
+    """
+    keyframe = _find_next_keyframe(input_file, start_seconds)
+    source_codec = probe_video_codec(input_file)
+    head_encoder = (
+        _PRECISE_HEAD_ENCODERS.get(source_codec) if source_codec else None
+    )
+    input_str = os.fspath(input_file)
+
+    if keyframe is not None and keyframe <= start_seconds + 0.001:
+        # Start already sits on a keyframe; plain stream copy is exact.
+        _run_ffmpeg(
+            build_command(
+                ffmpeg_path,
+                input_str,
+                output_file,
+                format_timestamp(start_seconds),
+                format_timestamp(end_seconds - start_seconds),
+            )
+        )
+        return
+
+    if keyframe is None or keyframe >= end_seconds or head_encoder is None:
+        # No keyframe inside the range, or a source codec we can't match in
+        # the head: re-encode the whole range for the target container.
+        _run_ffmpeg(
+            (
+                ffmpeg_path,
+                *_FFMPEG_PREFIX,
+                "-ss",
+                format_timestamp(start_seconds),
+                "-t",
+                format_timestamp(end_seconds - start_seconds),
+                "-i",
+                input_str,
+                *_reencode_args(output_file.suffix.lower()),
+                str(output_file),
+            )
+        )
+        return
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="video_cutter_"))
+    try:
+        # Matroska segments: codec-agnostic, so the head encode never
+        # clashes with the source container's muxer rules.
+        head = tmp_dir / "head.mkv"
+        tail = tmp_dir / "tail.mkv"
+        _run_ffmpeg(
+            (
+                ffmpeg_path,
+                *_FFMPEG_PREFIX,
+                "-ss",
+                format_timestamp(start_seconds),
+                "-t",
+                format_timestamp(keyframe - start_seconds),
+                "-i",
+                input_str,
+                *head_encoder,
+                "-c:a",
+                "copy",
+                str(head),
+            )
+        )
+        _run_ffmpeg(
+            build_command(
+                ffmpeg_path,
+                input_str,
+                tail,
+                format_timestamp(keyframe),
+                format_timestamp(end_seconds - keyframe),
+            )
+        )
+        concat_list = tmp_dir / "segments.txt"
+        concat_list.write_text(
+            "".join(f"file '{segment.as_posix()}'\n" for segment in (head, tail))
+        )
+        _run_ffmpeg(
+            (
+                ffmpeg_path,
+                *_FFMPEG_PREFIX,
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(concat_list),
+                *_FFMPEG_COPY,
+                str(output_file),
+            )
+        )
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _run_ffmpeg(
+    command: Tuple[str, ...],
+    progress_cb: Callable[[float], None] | None = None,
+    total_us: float | None = None,
+) -> None:
+    if progress_cb is None or not total_us:
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                "ffmpeg no pudo generar el recorte. "
+                "Revisa que el video y los timestamps sean válidos."
+            ) from exc
+        return
+
+    # With -progress pipe:1 ffmpeg streams key=value lines; out_time_ms is
+    # the produced output time in microseconds (historical name).
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, bufsize=1)
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if not line.startswith("out_time_ms="):
+            continue
+        try:
+            out_us = int(line.split("=", 1)[1])
+        except ValueError:
+            continue
+        progress_cb(min(1.0, max(0.0, out_us / total_us)))
+    if proc.wait() != 0:
+        raise RuntimeError(
+            "ffmpeg no pudo generar el recorte. "
+            "Revisa que el video y los timestamps sean válidos."
+        )
+    progress_cb(1.0)
+
+
+def cut_video(
+    input_file: Path,
+    start: str,
+    end: str,
+    output: Path | None,
+    precise: bool = False,
+    progress_cb: Callable[[float], None] | None = None,
+) -> Path:
+    # Validate before touching the filesystem: bad timestamps should not pay
+    # the (cold) ffmpeg candidate scan.
     start_seconds = parse_timestamp(start)
     end_seconds = parse_timestamp(end)
 
@@ -158,26 +532,131 @@ def cut_video(input_file: Path, start: str, end: str, output: Path | None) -> Pa
     if end_seconds <= start_seconds:
         raise ValueError("El tiempo final debe ser mayor que el inicial.")
 
-    formatted_start = format_timestamp(start_seconds)
-    formatted_end = format_timestamp(end_seconds)
+    ffmpeg_path = ensure_ffmpeg_available()
 
     if output is None:
         suffix = f"{int(start_seconds)}s_{int(end_seconds)}s"
         output = build_output_path(input_file, suffix)
 
-    command = build_command(
-        ffmpeg_path, input_file, output, formatted_start, formatted_end
-    )
+    if precise:
+        # Precise mode is multi-stage; report only start/completion.
+        if progress_cb is not None:
+            progress_cb(0.0)
+        _cut_precise(ffmpeg_path, input_file, output, start_seconds, end_seconds)
+        if progress_cb is not None:
+            progress_cb(1.0)
+        return output
+
+    out_ext = output.suffix.lower()
+    if out_ext == input_file.suffix.lower() or _container_accepts_codec(
+        out_ext, probe_video_codec(input_file)
+    ):
+        command = build_command(
+            ffmpeg_path,
+            input_file,
+            output,
+            format_timestamp(start_seconds),
+            format_timestamp(end_seconds - start_seconds),
+        )
+    else:
+        # Target container can't hold the source codec; stream copy would
+        # produce a broken file, so re-encode instead.
+        command = (
+            ffmpeg_path,
+            *_FFMPEG_PREFIX,
+            "-ss",
+            format_timestamp(start_seconds),
+            "-t",
+            format_timestamp(end_seconds - start_seconds),
+            "-i",
+            os.fspath(input_file),
+            *_reencode_args(out_ext),
+            os.fspath(output),
+        )
+    total_us: float | None = None
+    if progress_cb is not None:
+        # Insert the progress flags before the trailing output path.
+        command = command[:-1] + ("-progress", "pipe:1", "-nostats") + command[-1:]
+        total_us = (end_seconds - start_seconds) * 1_000_000
+    _run_ffmpeg(command, progress_cb, total_us)
+    return output
 
-    try:
-        subprocess.run(command, check=True)
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(
-            "ffmpeg no pudo generar el recorte. "
-            "Revisa que el video y los timestamps sean válidos."
-        ) from exc
 
-    return output
+def cut_video_batch(
+    input_file: Path,
+    segments: Sequence[Tuple[str, str, Path | None]],
+) -> list[Path]:
+    """
+    Cut several segments from the same source with a single ffmpeg run.
+
+    Each segment is a ``(start, end, output)`` tuple; ``output`` may be
+    ``None`` to auto-name the file next to the source. One invocation with
+    multiple output groups amortizes process spawn and input demux/parse
+    across all segments instead of paying them once per cut.
+    """
+    if not segments:
+        return []
+
+    # Validate every segment before resolving ffmpeg or spawning anything.
+    parsed: list[Tuple[float, float, Path | None]] = []
+    for start, end, output in segments:
+        start_seconds = parse_timestamp(start)
+        end_seconds = parse_timestamp(end)
+        if start_seconds < 0 or end_seconds < 0:
+            raise ValueError("Los tiempos deben ser mayores o iguales a 0.")
+        if end_seconds <= start_seconds:
+            raise ValueError("El tiempo final debe ser mayor que el inicial.")
+        parsed.append((start_seconds, end_seconds, output))
+
+    ffmpeg_path = ensure_ffmpeg_available()
+
+    command: list[str] = [
+        ffmpeg_path,
+        *_FFMPEG_PREFIX,
+        "-i",
+        os.fspath(input_file),
+    ]
+    outputs: list[Path] = []
+    for start_seconds, end_seconds, output in parsed:
+        if output is None:
+            suffix = f"{int(start_seconds)}s_{int(end_seconds)}s"
+            output = build_output_path(input_file, suffix)
+        command += (
+            "-ss",
+            format_timestamp(start_seconds),
+            "-to",
+            format_timestamp(end_seconds),
+            *_FFMPEG_COPY,
+            str(output),
+        )
+        outputs.append(output)
+
+    _run_ffmpeg(tuple(command))
+    return outputs
+
+
+def cut_videos_parallel(
+    jobs: Sequence[Tuple[Path, str, str, Path | None]],
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Run several independent ``cut_video`` jobs concurrently.
+
+    Each job is a ``(input_file, start, end, output)`` tuple. Threads are
+    enough here: the heavy lifting happens in external ffmpeg processes and
+    the GIL is released while waiting on them. ``max_workers`` defaults to
+    half the CPUs (at least 2) to avoid thrashing the disk, capped at the
+    job count. Results preserve submission order.
+    """
+    if not jobs:
+        return []
+
+    if max_workers is None:
+        max_workers = max(2, (os.cpu_count() or 2) // 2)
+    max_workers = min(len(jobs), max_workers)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda job: cut_video(*job), jobs))
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -204,6 +683,14 @@ def create_parser() -> argparse.ArgumentParser:
         "--output",
         help="Ruta del archivo de salida. Si se omite se generará automáticamente.",
     )
+    parser.add_argument(
+        "--precise",
+        action="store_true",
+        help=(
+            "Recorte exacto al fotograma: re-codifica solo el tramo inicial hasta "
+            "el siguiente keyframe (más lento que el modo por defecto)."
+        ),
+    )
     return parser
 
 
@@ -217,7 +704,9 @@ def main(argv: list[str] | None = None) -> int:
 
     output_file = Path(args.output).expanduser() if args.output else None
     try:
-        result = cut_video(input_file, args.start, args.end, output_file)
+        result = cut_video(
+            input_file, args.start, args.end, output_file, precise=args.precise
+        )
     except (ValueError, RuntimeError) as exc:
         parser.error(str(exc))
 
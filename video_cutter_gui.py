@@ -111,13 +111,23 @@ except Exception:
     pass
 
 import json
-import shutil
+import struct
 import subprocess
 import sys
-import threading
+import tempfile
 from pathlib import Path
-
-from PySide6.QtCore import Qt, QTimer, QUrl, QPoint, Signal
+from typing import Callable
+
+from PySide6.QtCore import (
+    QObject,
+    QPoint,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
 from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer, QVideoSink
 from PySide6.QtMultimediaWidgets import QVideoWidget
@@ -129,17 +139,143 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSlider,
     QVBoxLayout,
     QWidget,
 )
 
-from video_cutter import cut_video, format_timestamp, parse_timestamp
+from video_cutter import (
+    _find_keyframe_before,
+    _resolve_ffprobe,
+    build_command,
+    cut_video,
+    cut_video_batch,
+    ensure_ffmpeg_available,
+    format_timestamp,
+    parse_timestamp,
+)
 
 PREVIEW_LOOP_MARGIN_MS = 120
+# Only bother generating a preview proxy when the selected range is
+# meaningfully smaller than the whole video.
+PROXY_COVERAGE_LIMIT = 0.9
+
+# Session codec: orjson when available, otherwise stdlib json without the
+# whitespace padding. Both raise ValueError subclasses on bad input.
+try:
+    import orjson
+
+    def _json_dumps(data: dict) -> str:
+        return orjson.dumps(data).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(data: dict) -> str:
+        return json.dumps(data, separators=(",", ":"))
+
+    _json_loads = json.loads
 SESSION_FILE = Path.home() / ".video_cutter_session.json"
 
+# Distinguishes "never queried" from a cached None (probe failed), so failed
+# probes are not retried on every lookup.
+_MISS = object()
+
+
+def _find_box(fh, start: int, end: int, box_type: bytes) -> tuple[int, int] | None:
+    """
+    Walk ISO-BMFF boxes in ``fh`` between ``start`` and ``end`` and return
+    the payload span ``(payload_start, box_end)`` of the first ``box_type``
+    box, or ``None`` if absent.
+    """
+    pos = start
+    while pos + 8 <= end:
+        fh.seek(pos)
+        header = fh.read(8)
+        if len(header) < 8:
+            return None
+        size, kind = struct.unpack(">I4s", header)
+        payload = pos + 8
+        if size == 1:
+            # 64-bit largesize follows the regular header.
+            large = fh.read(8)
+            if len(large) < 8:
+                return None
+            size = struct.unpack(">Q", large)[0]
+            payload = pos + 16
+        elif size == 0:
+            size = end - pos
+        if size < 8:
+            return None
+        if kind == box_type:
+            return payload, pos + size
+        pos += size
+    return None
+
+
+def _fast_duration(video_path: Path) -> float | None:
+    """
+    Read the duration straight from the mp4/mov ``moov/mvhd`` box without
+    spawning ffprobe. Returns ``None`` for non-ISO-BMFF containers or on
+    any parse error, in which case the caller falls back to ffprobe.
+    """
+    try:
+        with video_path.open("rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            file_end = fh.tell()
+            moov = _find_box(fh, 0, file_end, b"moov")
+            if moov is None:
+                return None
+            mvhd = _find_box(fh, moov[0], moov[1], b"mvhd")
+            if mvhd is None:
+                return None
+            fh.seek(mvhd[0])
+            version_flags = fh.read(4)
+            if len(version_flags) < 4:
+                return None
+            if version_flags[0] == 1:
+                # v1: 64-bit creation/modification times, 64-bit duration.
+                fh.seek(16, os.SEEK_CUR)
+                timescale, duration = struct.unpack(">IQ", fh.read(12))
+                unknown = 0xFFFF_FFFF_FFFF_FFFF
+            else:
+                fh.seek(8, os.SEEK_CUR)
+                timescale, duration = struct.unpack(">II", fh.read(8))
+                unknown = 0xFFFF_FFFF
+    except (OSError, struct.error):
+        return None
+    if timescale <= 0:
+        return None
+    # Fragmented/DASH files leave mvhd at 0 and live streams use the
+    # all-ones sentinel; both mean "ask ffprobe instead".
+    if duration == 0 or duration == unknown:
+        return None
+    return duration / timescale
+
+
+class CutWorker(QObject, QRunnable):
+    """Run a cut job on Qt's global thread pool and report back via signals."""
+
+    finished = Signal(str)
+    failed = Signal(str)
+    progress = Signal(float)
+
+    def __init__(self, job: Callable[[Callable[[float], None]], str]) -> None:
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self._job = job
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            result = self._job(self.progress.emit)
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(str(exc))
+        else:
+            self.finished.emit(result)
+
 
 class RangeSlider(QWidget):
     """Simple horizontal range slider with two handles (lower/upper)."""
@@ -315,6 +451,8 @@ class VideoCutterWindow(QMainWindow):
         self.file_path: Path | None = None
         self.last_dir: Path = Path.home()
         self.duration_cache: dict[Path, float | None] = {}
+        self.persisted_durations: dict[str, float] = {}
+        self.segment_queue: list[tuple[str, str]] = []
         self.start_ms = 0
         self.end_ms = 1000
         self.slider_max_range = 1000
@@ -322,6 +460,7 @@ class VideoCutterWindow(QMainWindow):
         self.preview_paused = False
         self.slider_dragging = False
         self.pending_preview_restart = False
+        self._pending_restart_play = True
         self._normalizing_times = False
         self._updating_range_slider = False
         self._active_range_handle: str | None = None
@@ -331,6 +470,35 @@ class VideoCutterWindow(QMainWindow):
         self.thumbnail_popup = ThumbnailPopup(self)
         self.thumbnail_popup.hide()
 
+        # positionChanged fires at frame rate; coalesce slider updates to
+        # ~15 Hz, which is indistinguishable to the user.
+        self._pending_position: int | None = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(66)
+        self._slider_timer.timeout.connect(self._flush_slider_position)
+
+        # Session saves fire on every edit/drag; coalesce bursts into one
+        # disk write and skip writes whose payload did not change.
+        self._last_session_blob: str | None = None
+        self._session_timer = QTimer(self)
+        self._session_timer.setSingleShot(True)
+        self._session_timer.setInterval(500)
+        self._session_timer.timeout.connect(self._write_session)
+
+        # Ranged preview proxy: instead of letting QMediaPlayer index the
+        # whole file to play [start, end], stream-copy that segment into a
+        # temp file in the background and point the player at it. Positions
+        # stay in absolute video time via _proxy_offset_ms.
+        self._proxy_path: Path | None = None
+        self._proxy_range: tuple[int, int] | None = None
+        self._proxy_offset_ms = 0
+        self._proxy_worker: CutWorker | None = None
+        self._proxy_timer = QTimer(self)
+        self._proxy_timer.setSingleShot(True)
+        self._proxy_timer.setInterval(500)
+        self._proxy_timer.timeout.connect(self._build_preview_proxy)
+
         self._build_ui()
         self._setup_player()
         self._connect_ui()
@@ -384,8 +552,17 @@ class VideoCutterWindow(QMainWindow):
         controls_layout.addWidget(self.forward_button)
         main_layout.addLayout(controls_layout)
 
+        cut_layout = QHBoxLayout()
+        self.add_segment_button = QPushButton("Añadir segmento")
         self.cut_button = QPushButton("Generar recorte")
-        main_layout.addWidget(self.cut_button)
+        cut_layout.addWidget(self.add_segment_button)
+        cut_layout.addWidget(self.cut_button, stretch=1)
+        main_layout.addLayout(cut_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        main_layout.addWidget(self.progress_bar)
 
         self.status_label = QLabel("Selecciona un video para comenzar.")
         self.status_label.setWordWrap(True)
@@ -436,6 +613,7 @@ class VideoCutterWindow(QMainWindow):
         self.play_button.clicked.connect(self._toggle_playback)
         self.rewind_button.clicked.connect(lambda: self._seek_by_ms(-1000))
         self.forward_button.clicked.connect(lambda: self._seek_by_ms(1000))
+        self.add_segment_button.clicked.connect(self._on_add_segment)
         self.cut_button.clicked.connect(self.on_cut_click)
 
     # ----------------------------------------------------------- File Flow ---
@@ -452,11 +630,14 @@ class VideoCutterWindow(QMainWindow):
         video_path = Path(path)
         self.file_path = video_path
         self.last_dir = video_path.parent
+        self.segment_queue.clear()
+        self._reset_proxy_state()
         self.file_edit.setText(str(video_path))
         self.status_label.setText("Cargando vista previa…")
         self._populate_default_times(video_path)
         self.player.setSource(QUrl.fromLocalFile(str(video_path)))
         self.pending_preview_restart = True
+        self._pending_restart_play = True
         self._update_controls(True)
         self._save_session()
 
@@ -630,7 +811,7 @@ class VideoCutterWindow(QMainWindow):
         target = self.start_ms + relative
         upper_bound = max(self.start_ms, self.end_ms - PREVIEW_LOOP_MARGIN_MS)
         target = min(upper_bound, max(self.start_ms, target))
-        self.player.setPosition(target)
+        self.player.setPosition(target - self._proxy_offset_ms)
         if not self.preview_paused:
             self.player.play()
 
@@ -651,11 +832,11 @@ class VideoCutterWindow(QMainWindow):
     def _seek_by_ms(self, delta: int) -> None:
         if not self.file_path:
             return
-        position = self.player.position()
+        position = self.player.position() + self._proxy_offset_ms
         target = position + delta
         upper_bound = max(self.start_ms, self.end_ms - PREVIEW_LOOP_MARGIN_MS)
         target = min(upper_bound, max(self.start_ms, target))
-        self.player.setPosition(target)
+        self.player.setPosition(target - self._proxy_offset_ms)
         if not self.slider_dragging:
             self.preview_slider.setValue(max(0, target - self.start_ms))
         if not self.preview_paused:
@@ -664,14 +845,24 @@ class VideoCutterWindow(QMainWindow):
     def _on_position_changed(self, position: int) -> None:
         if not self.file_path:
             return
+        position += self._proxy_offset_ms
         if not self.preview_paused and position >= self.end_ms - PREVIEW_LOOP_MARGIN_MS:
-            self.player.setPosition(self.start_ms)
+            # The loop-back seek stays immediate; only slider cosmetics are
+            # throttled.
+            self.player.setPosition(self.start_ms - self._proxy_offset_ms)
             position = self.start_ms
-        if not self.slider_dragging:
-            relative = max(0, min(self.slider_max_range, position - self.start_ms))
-            self.preview_slider.blockSignals(True)
-            self.preview_slider.setValue(relative)
-            self.preview_slider.blockSignals(False)
+        self._pending_position = position
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+
+    def _flush_slider_position(self) -> None:
+        position = self._pending_position
+        if position is None or self.slider_dragging:
+            return
+        relative = max(0, min(self.slider_max_range, position - self.start_ms))
+        self.preview_slider.blockSignals(True)
+        self.preview_slider.setValue(relative)
+        self.preview_slider.blockSignals(False)
 
     def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
         if self.pending_preview_restart and status in (
@@ -680,7 +871,7 @@ class VideoCutterWindow(QMainWindow):
             QMediaPlayer.LoadedMedia,
         ):
             self.pending_preview_restart = False
-            self._restart_preview(auto_play=True)
+            self._restart_preview(auto_play=self._pending_restart_play)
 
     def _on_media_error(self, error: QMediaPlayer.Error, message: str) -> None:
         if error == QMediaPlayer.NoError:
@@ -691,6 +882,8 @@ class VideoCutterWindow(QMainWindow):
     def _restart_preview_if_ready(self) -> None:
         if not self.file_path:
             return
+        # Regenerate the preview proxy once the range stops moving.
+        self._proxy_timer.start()
         if self.player.mediaStatus() in (
             QMediaPlayer.BufferingMedia,
             QMediaPlayer.BufferedMedia,
@@ -699,9 +892,10 @@ class VideoCutterWindow(QMainWindow):
             self._restart_preview(auto_play=not self.preview_paused)
         else:
             self.pending_preview_restart = True
+            self._pending_restart_play = not self.preview_paused
 
     def _restart_preview(self, auto_play: bool) -> None:
-        self.player.setPosition(self.start_ms)
+        self.player.setPosition(self.start_ms - self._proxy_offset_ms)
         self.preview_slider.setValue(0)
         if self.file_path:
             self.thumb_player.setSource(QUrl.fromLocalFile(str(self.file_path)))
@@ -726,6 +920,7 @@ class VideoCutterWindow(QMainWindow):
         ):
             widget.setEnabled(enabled)
         self.cut_button.setEnabled(enabled)
+        self.add_segment_button.setEnabled(enabled)
         if not enabled:
             self.thumbnail_popup.hide()
             self._thumbnail_handle = None
@@ -734,10 +929,37 @@ class VideoCutterWindow(QMainWindow):
             self.thumbnail_popup.hide()
 
     # ------------------------------------------------------------ Cutting ---
+    def _on_add_segment(self) -> None:
+        if not self.file_path:
+            QMessageBox.warning(self, "Falta archivo", "Selecciona un archivo de video.")
+            return
+        start = self.start_edit.text().strip()
+        end = self.end_edit.text().strip()
+        if not start or not end:
+            QMessageBox.warning(self, "Faltan tiempos", "Introduce inicio y fin.")
+            return
+        self.segment_queue.append((start, end))
+        self.status_label.setText(
+            f"{len(self.segment_queue)} segmento(s) en cola. "
+            "Pulsa «Generar recorte» para procesarlos."
+        )
+
     def on_cut_click(self) -> None:
         if not self.file_path:
             QMessageBox.warning(self, "Falta archivo", "Selecciona un archivo de video.")
             return
+        if self.segment_queue:
+            segments = [(start, end, None) for start, end in self.segment_queue]
+            self.segment_queue.clear()
+            input_path = self.file_path
+            self.cut_button.setEnabled(False)
+            self.status_label.setText("Procesando segmentos…")
+            self._start_cut_worker(
+                lambda _report: "\n".join(
+                    str(path) for path in cut_video_batch(input_path, segments)
+                )
+            )
+            return
         start = self.start_edit.text().strip()
         end = self.end_edit.text().strip()
         if not start or not end:
@@ -757,45 +979,79 @@ class VideoCutterWindow(QMainWindow):
         if not output_path:
             return
 
+        input_path = self.file_path
+        output = Path(output_path)
         self.cut_button.setEnabled(False)
         self.status_label.setText("Procesando recorte…")
-        threading.Thread(
-            target=self._run_cut,
-            args=(self.file_path, start, end, Path(output_path)),
-            daemon=True,
-        ).start()
+        self._start_cut_worker(
+            lambda report: str(
+                cut_video(input_path, start, end, output, progress_cb=report)
+            )
+        )
 
-    def _run_cut(self, input_path: Path, start: str, end: str, output: Path) -> None:
-        try:
-            result = cut_video(input_path, start, end, output)
-        except Exception as exc:  # noqa: BLE001
-            QTimer.singleShot(0, lambda: self._on_cut_failed(str(exc)))
-        else:
-            QTimer.singleShot(0, lambda: self._on_cut_success(str(result)))
+    def _start_cut_worker(self, job: Callable[[Callable[[float], None]], str]) -> None:
+        worker = CutWorker(job)
+        worker.finished.connect(self._on_cut_success)
+        worker.failed.connect(self._on_cut_failed)
+        worker.progress.connect(self._on_cut_progress)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        # Keep a reference so the worker outlives this scope until its
+        # signals are delivered.
+        self._cut_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_cut_progress(self, fraction: float) -> None:
+        self.progress_bar.setValue(int(fraction * 100))
 
     def _on_cut_success(self, path: str) -> None:
+        self.progress_bar.setVisible(False)
         self.cut_button.setEnabled(True)
         self.status_label.setText(f"Recorte listo: {path}")
         QMessageBox.information(self, "Recorte listo", f"Video generado en:\n{path}")
         self._save_session()
 
     def _on_cut_failed(self, message: str) -> None:
+        self.progress_bar.setVisible(False)
         self.cut_button.setEnabled(True)
         self.status_label.setText("Error generando el recorte.")
         QMessageBox.critical(self, "Error", message)
 
     # ------------------------------------------------------------- Helpers ---
     def _get_cached_duration(self, video_path: Path | None) -> float | None:
-        if not video_path or not video_path.exists():
+        if not video_path:
+            return None
+        # Hot path: dict hit costs one lookup and no syscall.
+        cached = self.duration_cache.get(video_path, _MISS)
+        if cached is not _MISS:
+            return cached
+        if not video_path.exists():
             return None
-        if video_path in self.duration_cache:
-            return self.duration_cache[video_path]
-        duration = self._probe_duration(video_path)
+        key = self._duration_key(video_path)
+        if key is not None and key in self.persisted_durations:
+            duration = self.persisted_durations[key]
+            self.duration_cache[video_path] = duration
+            return duration
+        duration = _fast_duration(video_path)
+        if duration is None:
+            duration = self._probe_duration(video_path)
         self.duration_cache[video_path] = duration
+        if duration is not None and key is not None:
+            self.persisted_durations[key] = duration
         return duration
 
+    @staticmethod
+    def _duration_key(video_path: Path) -> str | None:
+        # mtime/size in the key make invalidation automatic when the file
+        # is replaced.
+        try:
+            stat = video_path.stat()
+        except OSError:
+            return None
+        return f"{video_path}|{stat.st_mtime_ns}|{stat.st_size}"
+
     def _probe_duration(self, video_path: Path) -> float | None:
-        ffprobe_path = shutil.which("ffprobe")
+        ffprobe_path = _resolve_ffprobe()
         if not ffprobe_path:
             return None
         command = [
@@ -825,7 +1081,10 @@ class VideoCutterWindow(QMainWindow):
     def closeEvent(self, event):  # type: ignore[override]
         self.player.stop()
         self.thumb_player.stop()
-        self._save_session()
+        self._proxy_timer.stop()
+        self._reset_proxy_state()
+        self._session_timer.stop()
+        self._write_session()
         super().closeEvent(event)
 
     # ------------------------------------------------------ Thumbnail Flow ---
@@ -851,19 +1110,140 @@ class VideoCutterWindow(QMainWindow):
         self.thumbnail_popup.update_thumbnail(pixmap)
         self._position_thumbnail_popup(None)
 
+    # ------------------------------------------------------- Preview Proxy ---
+    def _build_preview_proxy(self) -> None:
+        if not self.file_path or self.video_duration_ms <= 0:
+            return
+        span = self.end_ms - self.start_ms
+        if span <= 0 or span >= self.video_duration_ms * PROXY_COVERAGE_LIMIT:
+            # Nearly the whole video selected: the proxy would not save
+            # anything, play the original.
+            self._clear_proxy()
+            return
+        target_range = (self.start_ms, self.end_ms)
+        if target_range == self._proxy_range:
+            return
+
+        input_path = self.file_path
+        start_s = self.start_ms / 1000
+        end_s = self.end_ms / 1000
+        # Matroska holds any codec, so the stream copy never fails on
+        # container grounds.
+        fd, tmp_name = tempfile.mkstemp(prefix="video_cutter_preview_", suffix=".mkv")
+        os.close(fd)
+        offset_holder: dict[str, int] = {}
+
+        def job(_report: Callable[[float], None]) -> str:
+            # Input-side -ss with -c copy snaps to the previous keyframe, so
+            # probe that keyframe ourselves: seeking to it explicitly keeps
+            # the full [start, end] range in the proxy and pins down which
+            # absolute time proxy t=0 corresponds to.
+            seek_s = _find_keyframe_before(input_path, start_s)
+            if seek_s is None or seek_s > start_s:
+                seek_s = start_s
+            command = build_command(
+                ensure_ffmpeg_available(),
+                input_path,
+                tmp_name,
+                format_timestamp(seek_s),
+                format_timestamp(end_s - seek_s),
+            )
+            subprocess.run(command, check=True, capture_output=True)
+            offset_ms = int(seek_s * 1000)
+            # Refine against the finished proxy: its last frame sits at
+            # end_ms, so the probed length locates t=0 even after muxer
+            # timestamp shifts.
+            duration = self._probe_duration(Path(tmp_name))
+            if duration is not None:
+                offset_ms = target_range[1] - int(duration * 1000)
+            offset_holder["ms"] = max(0, min(offset_ms, target_range[0]))
+            return tmp_name
+
+        worker = CutWorker(job)
+        worker.finished.connect(
+            lambda path, r=target_range, h=offset_holder: self._on_proxy_ready(
+                path, r, h.get("ms", r[0])
+            )
+        )
+        worker.failed.connect(lambda _msg, p=tmp_name: Path(p).unlink(missing_ok=True))
+        self._proxy_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_proxy_ready(
+        self, path: str, proxy_range: tuple[int, int], offset_ms: int
+    ) -> None:
+        if not self.file_path or (self.start_ms, self.end_ms) != proxy_range:
+            # Range moved while the proxy was being written; the debounce
+            # timer has already scheduled a fresh one.
+            Path(path).unlink(missing_ok=True)
+            return
+        old_proxy = self._proxy_path
+        self._proxy_path = Path(path)
+        self._proxy_range = proxy_range
+        self._proxy_offset_ms = offset_ms
+        self.pending_preview_restart = True
+        self._pending_restart_play = not self.preview_paused
+        # Swap the player off the old proxy before deleting it; unlinking a
+        # file the player still holds open fails on Windows.
+        self.player.setSource(QUrl.fromLocalFile(path))
+        if old_proxy is not None:
+            try:
+                old_proxy.unlink()
+            except OSError:
+                pass
+
+    def _clear_proxy(self) -> None:
+        old_proxy = self._proxy_path
+        self._proxy_path = None
+        self._proxy_range = None
+        self._proxy_offset_ms = 0
+        if old_proxy is None:
+            return
+        if self.file_path:
+            self.pending_preview_restart = True
+            self._pending_restart_play = not self.preview_paused
+            self.player.setSource(QUrl.fromLocalFile(str(self.file_path)))
+        try:
+            old_proxy.unlink()
+        except OSError:
+            pass
+
+    def _reset_proxy_state(self) -> None:
+        old_proxy = self._proxy_path
+        self._proxy_path = None
+        self._proxy_range = None
+        self._proxy_offset_ms = 0
+        if old_proxy is None:
+            return
+        # Detach the player first: stop() does not unload the media, and
+        # Windows refuses to unlink a file the player still holds open.
+        self.player.setSource(QUrl())
+        try:
+            old_proxy.unlink()
+        except OSError:
+            pass
+
     # -------------------------------------------------------- Session I/O ---
     def _load_session(self) -> None:
         if not SESSION_FILE.exists():
             return
         try:
-            data = json.loads(SESSION_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
+            data = _json_loads(SESSION_FILE.read_text())
+        except (ValueError, OSError):
             return
 
         last_dir = data.get("last_dir")
         if last_dir:
             self.last_dir = Path(last_dir)
 
+        durations = data.get("durations")
+        if isinstance(durations, dict):
+            self.persisted_durations = {
+                key: float(value)
+                for key, value in durations.items()
+                if isinstance(value, (int, float))
+            }
+
         file_str = data.get("file")
         start = data.get("start")
         end = data.get("end")
@@ -888,21 +1268,37 @@ class VideoCutterWindow(QMainWindow):
             self.video_duration_ms = max(self.video_duration_ms, 10000)
         self.player.setSource(QUrl.fromLocalFile(str(path)))
         self.pending_preview_restart = True
+        self._pending_restart_play = True
         self._update_controls(True)
         self._normalize_times("start")
         self.status_label.setText("Vista previa lista.")
 
     def _save_session(self) -> None:
+        # Debounced: bursts of calls (focus changes, drags) collapse into a
+        # single write once the timer fires.
+        if not self._session_timer.isActive():
+            self._session_timer.start()
+
+    def _write_session(self) -> None:
         data = {
             "file": str(self.file_path) if self.file_path else "",
             "start": self.start_edit.text().strip(),
             "end": self.end_edit.text().strip(),
             "last_dir": str(self.last_dir) if self.last_dir else "",
+            "durations": self.persisted_durations,
         }
+        blob = _json_dumps(data)
+        if blob == self._last_session_blob:
+            return
         try:
-            SESSION_FILE.write_text(json.dumps(data))
+            # Write-then-rename keeps the session file whole even if we
+            # crash mid-write.
+            tmp = SESSION_FILE.with_suffix(".tmp")
+            tmp.write_text(blob)
+            os.replace(tmp, SESSION_FILE)
         except OSError:
-            pass
+            return
+        self._last_session_blob = blob
 
 
 def main() -> None: